@@ -4,16 +4,18 @@ __version__ = "2024.8.0"
 
 # standard library
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from importlib import import_module
 from logging import DEBUG, basicConfig, getLogger
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 
 # dependencies
-from fire import Fire
-from . import data, merge, reduce
+if TYPE_CHECKING:
+    from . import data, merge, reduce
 
 
 # type hints
@@ -23,6 +25,15 @@ PathLike = Union[Path, str]
 # constants
 LOGGER = getLogger(__name__)
 PACKAGE_DATA = Path(__file__).parent / "data"
+SUBMODULES = ("data", "merge", "reduce")
+
+
+def __getattr__(name: str) -> Any:
+    """Import a submodule on first access (PEP 562)."""
+    if name in SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @contextmanager
@@ -75,6 +86,7 @@ def demerge(
         reduced_dir: Path of directory where reduced packages are placed,
             i.e. expecting ``${reduced_dir}/reduced_YYYYmmddHHMMSS``.
             If not specified, a temporary directory will be used.
+            An existing reduced package will be reused unless overwrite is True.
         ddb: Path of DDB (DESHIMA database) file.
         measure: Measure of the DEMS (either df/f or brightness).
         overwrite: If True, the reduced package and the merged DEMS file
@@ -87,25 +99,36 @@ def demerge(
 
     """
     with set_logger(debug):
-        for key, val in locals().items():
-            LOGGER.debug(f"{key}: {val!r}")
+        if LOGGER.isEnabledFor(DEBUG):
+            for key, val in locals().items():
+                LOGGER.debug("%s: %r", key, val)
+
+    # deferred so that importing the package stays lightweight
+    from . import data, merge, reduce
 
     with (
         set_dir(data_dir) as data_dir,
         set_dir(dems_dir) as dems_dir,
         set_dir(reduced_dir) as reduced_dir,
     ):
-        data_pack = Path(data_dir).resolve() / f"cosmos_{obsid}"
+        data_pack = data_dir / f"cosmos_{obsid}"
         reduced_pack = reduced_dir / f"reduced_{obsid}"
         data_pack_ = data.parse(data_pack)
 
-        # Run reduce function
-        readout = reduce.reduce(
-            data_pack=data_pack,
-            reduced_pack=reduced_pack,
-            overwrite=overwrite,
-            debug=debug,
-        )
+        # Run reduce function (while caching the DDB for merge)
+        with ThreadPoolExecutor(1) as executor:
+            executor.submit(merge.utils.get_ddb, ddb)
+
+            # reuse the reduced FITS of a previous run if exists
+            readout = next(reduced_pack.glob("*.fits"), None)
+
+            if overwrite or readout is None:
+                readout = reduce.reduce(
+                    data_pack=data_pack,
+                    reduced_pack=reduced_pack,
+                    overwrite=overwrite,
+                    debug=debug,
+                )
 
         # Run merge function
         return merge.merge(
@@ -131,6 +154,8 @@ def demerge(
 
 def demerge_cli() -> None:
     """Command line interface of the demerge function."""
+    from fire import Fire
+
     basicConfig(
         datefmt="%Y-%m-%d %H:%M:%S",
         format="[%(asctime)s %(name)s %(funcName)s %(levelname)s] %(message)s",
@@ -2,8 +2,10 @@ __all__ = ["DataPackage", "parse"]
 
 
 # standard library
-from collections.abc import Iterator
+import os
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
@@ -12,7 +14,7 @@ from typing import Optional, Union
 PathLike = Union[Path, str]
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataPackage:
     """Parsed data package structure."""
 
@@ -41,33 +43,50 @@ class DataPackage:
     """Path of the weather log (optional)."""
 
 
-def first(glob_results: Iterator[Path], /) -> Optional[Path]:
-    """Return the first Path.glob result if exists."""
-    for path in glob_results:
-        return path
+def parse(data_pack: PathLike, /) -> DataPackage:
+    """Parse a data package (cached until the directory changes)."""
+    data_pack = Path(data_pack).absolute()
 
+    try:
+        mtime = data_pack.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(data_pack) from None
 
-def parse(data_pack: PathLike, /) -> DataPackage:
-    """Parse a data package (data directory)."""
-    if not (data_pack := Path(data_pack)).exists():
-        raise FileNotFoundError(data_pack)
+    return scan(data_pack, mtime)
+
+
+@lru_cache(maxsize=16)
+def scan(data_pack: Path, mtime: int, /) -> DataPackage:
+    """Scan a data package (mtime is used as a cache key)."""
+    # group the paths by suffix in a single directory pass
+    # (keys ending with "*" also include paths with more suffixes)
+    paths: defaultdict[str, list[Path]] = defaultdict(list)
+
+    with os.scandir(data_pack) as entries:
+        for entry in entries:
+            path = Path(entry.path)
+            paths[path.suffix].append(path)
+
+            for suffix in path.suffixes:
+                paths[f"{suffix}*"].append(path)
 
-    if (corresp := first(data_pack.glob("*.json"))) is None:
+    # select the first path in name order (not in directory order)
+    if (corresp := min(paths[".json"], default=None)) is None:
         raise FileNotFoundError("KID correspondence (*.json).")
 
-    if (obsinst := first(data_pack.glob("*.obs"))) is None:
+    if (obsinst := min(paths[".obs"], default=None)) is None:
         raise FileNotFoundError(f"Observation instruction (*.obs).")
 
-    if (readout := first(data_pack.glob("*.fits*"))) is None:
+    if (readout := min(paths[".fits*"], default=None)) is None:
         raise FileNotFoundError(f"KID readout FITS (*.fits).")
 
     return DataPackage(
-        antenna=first(data_pack.glob("*.ant")),
-        cabin=first(data_pack.glob("*.cabin")),
+        antenna=min(paths[".ant"], default=None),
+        cabin=min(paths[".cabin"], default=None),
         corresp=corresp,
-        misti=first(data_pack.glob("*.misti")),
+        misti=min(paths[".misti"], default=None),
         obsinst=obsinst,
         readout=readout,
-        skychop=first(data_pack.glob("*.skychopper*")),
-        weather=first(data_pack.glob("*.wea")),
+        skychop=min(paths[".skychopper*"], default=None),
+        weather=min(paths[".wea"], default=None),
     )
@@ -1,17 +1,17 @@
-__all__ = ["merge"]
+__all__ = ["merge", "merge_many"]
 
 
 # standard library
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from logging import DEBUG, basicConfig, getLogger
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, Union
 
 
 # dependencies
-from fire import Fire
-from .utils import to_brightness, to_dems
+from .utils import to_brightness, to_dems, write_dems
 
 
 # type hints
@@ -59,6 +59,7 @@ def merge(
     dt_weather: Union[int, str] = "0 ms",
     # merge options
     measure: Literal["df/f", "brightness"] = "df/f",
+    chunk_size: Union[int, str] = "8 MiB",
     overwrite: bool = False,
     debug: bool = False,
 ) -> Path:
@@ -87,6 +88,9 @@ def merge(
         dt_weather: Time offset of the weather log with explicit
             unit such that (dt_weather = t_weather - t_readout).
         measure: Measure of the DEMS (either df/f or brightness).
+        chunk_size: Approximate (uncompressed) size of each data chunk
+            of the DEMS with explicit unit (or in bytes if int).
+            Each chunk holds all channels over consecutive samples.
         overwrite: If True, ``dems`` will be overwritten even if it exists.
         debug: If True, detailed logs for debugging will be printed.
 
@@ -98,8 +102,9 @@ def merge(
 
     """
     with set_logger(debug):
-        for key, val in locals().items():
-            LOGGER.debug(f"{key}: {val!r}")
+        if LOGGER.isEnabledFor(DEBUG):
+            for key, val in locals().items():
+                LOGGER.debug("%s: %r", key, val)
 
     da = to_dems(
         # required datasets
@@ -124,19 +129,41 @@ def merge(
     if measure == "brightness":
         da = to_brightness(da)
 
-    if (dems := Path(dems)).exists() and not overwrite:
-        raise FileExistsError(dems)
+    return write_dems(da, dems, chunk_size=chunk_size, overwrite=overwrite)
 
-    if overwrite:
-        dems.unlink(missing_ok=True)
 
-    dems.parent.mkdir(exist_ok=True, parents=True)
-    da.to_zarr(dems, mode="w")
-    return dems.resolve()
+def merge_many(
+    specs: Sequence[dict[str, Any]],
+    /,
+    *,
+    max_workers: Optional[int] = None,
+) -> list[Path]:
+    """Merge datasets of multiple observations in parallel processes.
+
+    Args:
+        specs: Arguments of the merge function for each observation
+            as a dictionary (``dems`` must be included as a key).
+        max_workers: Maximum number of worker processes.
+            If not specified, the number of CPUs will be used.
+
+    Returns:
+        Paths of the merged DEMS (in the same order as ``specs``).
+
+    """
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(merge_spec, specs))
+
+
+def merge_spec(spec: dict[str, Any], /) -> Path:
+    """Run the merge function with arguments given as a dictionary."""
+    kwargs = dict(spec)
+    return merge(kwargs.pop("dems"), **kwargs)
 
 
 def merge_cli() -> None:
     """Command line interface of the merge function."""
+    from fire import Fire
+
     basicConfig(
         datefmt="%Y-%m-%d %H:%M:%S",
         format="[%(asctime)s %(name)s %(funcName)s %(levelname)s] %(message)s",
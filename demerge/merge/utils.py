@@ -1,11 +1,14 @@
-__all__ = ["to_brightness", "to_dems"]
+__all__ = ["to_brightness", "to_dems", "write_dems"]
 
 
 # standard library
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
+from functools import lru_cache
 from pathlib import Path
+from shutil import rmtree
 from typing import Any, Optional, Union
 from warnings import catch_warnings, simplefilter
 
@@ -18,6 +21,8 @@ from astropy.io import fits
 from astropy.units import Quantity
 from dems.d2 import MS
 from numpy.typing import NDArray
+from zarr.codecs import Blosc
+from zarr.storage import DirectoryStore, ZipStore
 from .. import __version__ as DEMERGE_VERSION
 
 
@@ -76,12 +81,18 @@ COLUMN_NAMES_WEATHER = (
     "wind_direction",  # deg
     "_",  # unknown
 )
+COMPRESSOR = Blosc("zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
 DATE_PARSER_ANTENNA = lambda s: dt.strptime(s, "%Y%m%d%H%M%S.%f")
 DATE_PARSER_CABIN = lambda s: dt.strptime(s, "%Y/%m/%d %H:%M")
 DATE_PARSER_MISTI = lambda s: dt.strptime(s, "%Y/%m/%d %H:%M:%S.%f")
 DATE_PARSER_SKYCHOP = lambda s: dt.utcfromtimestamp(float(s))
 DATE_PARSER_WEATHER = lambda s: dt.strptime(s, "%Y%m%d%H%M%S")
 PACKAGE_DATA = Path(__file__).parents[1] / "data"
+MISSING_ANTENNA = PACKAGE_DATA / "missing.ant"
+MISSING_CABIN = PACKAGE_DATA / "missing.cabin"
+MISSING_MISTI = PACKAGE_DATA / "missing.misti"
+MISSING_SKYCHOP = PACKAGE_DATA / "missing.skychop"
+MISSING_WEATHER = PACKAGE_DATA / "missing.wea"
 
 
 def get_antenna(antenna: PathLike, /) -> xr.Dataset:
@@ -132,49 +143,9 @@ def get_corresp(corresp: PathLike, /) -> xr.DataArray:
 
 
 def get_ddb(ddb: PathLike, /) -> xr.Dataset:
-    """Load a DDB FITS as xarray Dataset."""
-    dim = "masterid"
-
-    with fits.open(ddb) as hdus:
-        # read from PRIMARY HDU
-        version = hdus["PRIMARY"].header["DDB_ID"]
-
-        # read from KIDDES HDU
-        ds_kiddes = xr.Dataset(
-            coords={
-                dim: to_native((data := hdus["KIDDES"].data)[dim]),
-            },
-            data_vars={
-                "type": (dim, to_native(data["attribute"])),
-            },
-        ).drop_duplicates(dim)
-
-        # read from KIDFILT HDU
-        ds_kidfilt = xr.Dataset(
-            coords={
-                dim: to_native((data := hdus["KIDFILT"].data)[dim]),
-            },
-            data_vars={
-                "F": (dim, to_native(data["F_filter, df_filter"].T[0])),
-                "Q": (dim, to_native(data["Q_filter, dQ_filter"].T[0])),
-            },
-        ).drop_duplicates(dim)
-
-        # read from KIDRESP HDU
-        ds_kidresp = xr.Dataset(
-            coords={
-                dim: to_native((data := hdus["KIDRESP"].data)[dim]),
-            },
-            data_vars={
-                "p0": (dim, to_native(data["cal params"].T[0])),
-                "fwd": (dim, to_native(data["cal params"].T[1])),
-                "T0": (dim, to_native(data["cal params"].T[2])),
-            },
-        ).drop_duplicates(dim)
-
-    ds = xr.merge([ds_kiddes, ds_kidfilt, ds_kidresp])
-    ds = ds.where(ds.masterid >= 0, drop=True)
-    return ds.assign_attrs(version=version)
+    """Load a DDB FITS as xarray Dataset (cached until the file changes)."""
+    ddb = Path(ddb).resolve()
+    return read_ddb(ddb, ddb.stat().st_mtime_ns).copy(deep=True)
 
 
 def get_misti(misti: PathLike, /) -> xr.Dataset:
@@ -239,10 +210,10 @@ def get_readout(readout: PathLike, /) -> xr.DataArray:
         fr_room = kidsinfo["fr, dfr (Room)"].T[0]
         linyfc = kidsinfo["yfc, linyfc"].T[1]
 
-        # read from READOUT HDU
+        # read from READOUT HDU (only linear phase of each KID column)
         cols = readout_.columns[2:].names
         time = pd.to_datetime(readout_["timestamp"], unit="s")
-        linph = np.array([readout_[col] for col in cols]).T[1]
+        linph = np.stack([readout_[col][:, 1] for col in cols], axis=1)
 
     # calculate df/f (or fshift, dx)
     if np.isnan(fr_room).all():
@@ -288,6 +259,53 @@ def get_weather(weather: PathLike, /) -> xr.Dataset:
     ).to_xarray()
 
 
+@lru_cache(maxsize=4)
+def read_ddb(ddb: Path, mtime: int, /) -> xr.Dataset:
+    """Read a DDB FITS as xarray Dataset (mtime is used as a cache key)."""
+    dim = "masterid"
+
+    with fits.open(ddb) as hdus:
+        # read from PRIMARY HDU
+        version = hdus["PRIMARY"].header["DDB_ID"]
+
+        # read from KIDDES HDU
+        ds_kiddes = xr.Dataset(
+            coords={
+                dim: to_native((data := hdus["KIDDES"].data)[dim]),
+            },
+            data_vars={
+                "type": (dim, to_native(data["attribute"])),
+            },
+        ).drop_duplicates(dim)
+
+        # read from KIDFILT HDU
+        ds_kidfilt = xr.Dataset(
+            coords={
+                dim: to_native((data := hdus["KIDFILT"].data)[dim]),
+            },
+            data_vars={
+                "F": (dim, to_native(data["F_filter, df_filter"].T[0])),
+                "Q": (dim, to_native(data["Q_filter, dQ_filter"].T[0])),
+            },
+        ).drop_duplicates(dim)
+
+        # read from KIDRESP HDU
+        ds_kidresp = xr.Dataset(
+            coords={
+                dim: to_native((data := hdus["KIDRESP"].data)[dim]),
+            },
+            data_vars={
+                "p0": (dim, to_native(data["cal params"].T[0])),
+                "fwd": (dim, to_native(data["cal params"].T[1])),
+                "T0": (dim, to_native(data["cal params"].T[2])),
+            },
+        ).drop_duplicates(dim)
+
+    ds = xr.merge([ds_kiddes, ds_kidfilt, ds_kidresp])
+    ds = ds.where(ds.masterid >= 0, drop=True)
+    return ds.assign_attrs(version=version)
+
+
 def to_brightness(dfof: xr.DataArray, /) -> xr.DataArray:
     """Convert a DEMS of df/f to that of brightness."""
     if np.isnan(T_room := dfof.aste_cabin_temperature.mean().data):
@@ -368,27 +386,34 @@ def to_dems(
 
     # load optional datasets
     if antenna is None:
-        antenna = PACKAGE_DATA / "missing.ant"
+        antenna = MISSING_ANTENNA
 
     if cabin is None:
-        cabin = PACKAGE_DATA / "missing.cabin"
+        cabin = MISSING_CABIN
 
     if misti is None:
-        misti = PACKAGE_DATA / "missing.misti"
+        misti = MISSING_MISTI
 
     if skychop is None:
-        skychop = PACKAGE_DATA / "missing.skychop"
+        skychop = MISSING_SKYCHOP
 
     if weather is None:
-        weather = PACKAGE_DATA / "missing.wea"
+        weather = MISSING_WEATHER
 
-    with catch_warnings():
+    # read the (independent) logs concurrently to overlap file I/O
+    with catch_warnings(), ThreadPoolExecutor() as executor:
         simplefilter("ignore")
-        antenna_ = get_antenna(antenna)
-        cabin_ = get_cabin(cabin)
-        misti_ = get_misti(misti)
-        skychop_ = get_skychop(skychop)
-        weather_ = get_weather(weather)
+        future_antenna = executor.submit(get_antenna, antenna)
+        future_cabin = executor.submit(get_cabin, cabin)
+        future_misti = executor.submit(get_misti, misti)
+        future_skychop = executor.submit(get_skychop, skychop)
+        future_weather = executor.submit(get_weather, weather)
+
+    antenna_ = future_antenna.result()
+    cabin_ = future_cabin.result()
+    misti_ = future_misti.result()
+    skychop_ = future_skychop.result()
+    weather_ = future_weather.result()
 
     # merge datasets
     mkid = xr.merge([corresp_, readout_], join="left")
@@ -514,6 +539,79 @@ def to_native(array: NDArray[Any], /) -> NDArray[Any]:
     return array.astype(array.dtype.type)
 
 
+@lru_cache(maxsize=None)
 def to_timedelta(dt: Union[int, str], unit: str = "ms", /) -> np.timedelta64:
     """Convert a time offset to NumPy timedelta (float will be rounded)."""
     return np.timedelta64(int(Quantity(dt, unit=unit).to(unit).value), unit)
+
+
+def write_dems(
+    dems: xr.DataArray,
+    path: PathLike,
+    /,
+    *,
+    chunk_size: Union[int, str] = "8 MiB",
+    overwrite: bool = False,
+) -> Path:
+    """Write a DEMS to a Zarr store (e.g. ``dems_YYYYmmddHHMMSS.zarr.zip``).
+
+    Args:
+        dems: DEMS to be written.
+        path: Path of the Zarr store.
+        chunk_size: Approximate (uncompressed) size of each data chunk
+            of the DEMS with explicit unit (or in bytes if int).
+            Each chunk holds all channels over consecutive samples.
+        overwrite: If True, ``path`` will be overwritten even if it exists.
+
+    Returns:
+        Absolute path of the written Zarr store.
+
+    Raises:
+        FileExistsError: Raised if ``path`` exists and ``overwrite`` is False.
+
+    """
+    # chunk along time (each chunk has all channels) and compress
+    dems = dems.copy(deep=False)
+    n_time, n_chan = dems.sizes["time"], dems.sizes["chan"]
+    n_bytes = int(Quantity(chunk_size, unit="B").to("B").value)
+    n_chunk = n_bytes // max(n_chan * dems.dtype.itemsize, 1)
+    dems.encoding.update(
+        chunks=(max(min(n_chunk, n_time), 1), max(n_chan, 1)),
+        compressor=COMPRESSOR,
+    )
+
+    if (path := Path(path)).exists() and not overwrite:
+        raise FileExistsError(path)
+
+    # skip NaN-only chunks except in a zip store (which cannot delete keys)
+    dems.encoding.update(write_empty_chunks=path.suffix == ".zip")
+
+    # write to a hidden store next to the DEMS first
+    # so that an existing DEMS is replaced only after a successful write
+    temp = path.with_name(f".{path.name}")
+    path.parent.mkdir(exist_ok=True, parents=True)
+
+    try:
+        if temp.suffix == ".zip":
+            store = ZipStore(str(temp), mode="w")
+        else:
+            store = DirectoryStore(str(temp))
+
+        try:
+            dems.to_zarr(store, mode="w", consolidated=True)
+        finally:
+            store.close()
+
+        if path.is_dir():
+            rmtree(path)
+
+        temp.replace(path)
+    except BaseException:
+        if temp.is_dir():
+            rmtree(temp, ignore_errors=True)
+        else:
+            temp.unlink(missing_ok=True)
+
+        raise
+
+    return path.resolve()
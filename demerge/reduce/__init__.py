@@ -12,10 +12,6 @@ from tempfile import TemporaryDirectory
 from typing import Union
 
 
-# dependencies
-from fire import Fire
-
-
 # type hints
 PathLike = Union[Path, str]
 
@@ -68,8 +64,9 @@ def reduce(
 
     """
     with set_logger(debug):
-        for key, val in locals().items():
-            LOGGER.debug(f"{key}: {val!r}")
+        if LOGGER.isEnabledFor(DEBUG):
+            for key, val in locals().items():
+                LOGGER.debug("%s: %r", key, val)
 
     # Resolve paths (must be done before changing working directory)
     if not (data_pack := set_dir(data_pack)).exists():
@@ -110,6 +107,8 @@ def reduce(
 
 def reduce_cli() -> None:
     """Command line interface of the reduce function."""
+    from fire import Fire
+
     basicConfig(
         datefmt="%Y-%m-%d %H:%M:%S",
         format="[%(asctime)s %(name)s %(funcName)s %(levelname)s] %(message)s",